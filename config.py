@@ -1,70 +1,131 @@
 import os
-from dotenv import load_dotenv
+from dotenv import dotenv_values
+from functools import cache
 from pathlib import Path
+from typing import Dict, Final, Optional
 
-# Load environment variables
-load_dotenv()
+# Read .env once and merge it with the process environment. As with
+# load_dotenv(), variables already set in the environment take precedence.
+_ENV: Final[Dict[str, str]] = {
+    **{key: value for key, value in dotenv_values().items() if value is not None},
+    **os.environ
+}
+
+
+def get_env(name: str, default: Optional[str] = None) -> Optional[str]:
+    """Look up a configuration variable from the cached environment"""
+    return _ENV.get(name, default)
+
+
+# Module-level constants are resolved once at import; hot paths read these
+# directly instead of going through the Config class.
+
+# YouTube API Configuration
+YOUTUBE_API_KEY: Final[Optional[str]] = get_env('YOUTUBE_API_KEY')
+YOUTUBE_API_SERVICE_NAME: Final = 'youtube'
+YOUTUBE_API_VERSION: Final = 'v3'
+
+# Firebase Configuration
+FIREBASE_PROJECT_ID: Final[Optional[str]] = get_env('FIREBASE_PROJECT_ID')
+FIREBASE_CREDENTIALS_PATH: Final[str] = get_env(
+    'FIREBASE_CREDENTIALS_PATH', 'deployment/firebase/credentials.json')
+
+# Claude AI Configuration
+ANTHROPIC_API_KEY: Final[Optional[str]] = get_env('ANTHROPIC_API_KEY')
+CLAUDE_MODEL: Final = 'claude-3-sonnet-20240229'
+
+# Analysis Parameters
+MAX_VIDEOS_PER_SEARCH: Final = 50
+DEFAULT_REGION_CODE: Final = 'US'
+DEFAULT_LANGUAGE: Final = 'en'
+
+# Scoring Weights
+SENTIMENT_WEIGHT: Final = 0.3
+ENGAGEMENT_WEIGHT: Final = 0.4
+CREDIBILITY_WEIGHT: Final = 0.3
+
+# Directory Configuration
+PROJECT_ROOT: Final = Path(__file__).parent
+OUTPUT_DIR: Final = PROJECT_ROOT / 'output'
+MODELS_DIR: Final = PROJECT_ROOT / 'models'
+
+# MCP Server Configuration
+MCP_SERVER_NAME: Final = 'youtube-intelligence'
+MCP_SERVER_VERSION: Final = '1.0.0'
+MCP_SERVER_PORT: Final = 8000
+
+# Rate Limiting
+API_RATE_LIMIT: Final = 100  # requests per minute
+
+# Search result cache lifetime; repeated analyses within it cost no API quota
+SEARCH_CACHE_TTL: Final[int] = int(get_env('SEARCH_CACHE_TTL', '86400'))  # seconds
+
+# Logging (set LOG_LEVEL=INFO in production to skip debug records)
+LOG_LEVEL: Final[str] = get_env('LOG_LEVEL', 'DEBUG').upper()
+
+# Environment variables the server cannot run without
+REQUIRED_VARS: Final = ('YOUTUBE_API_KEY', 'FIREBASE_PROJECT_ID', 'ANTHROPIC_API_KEY')
+
+
+@cache
+def validate_config() -> bool:
+    """Validate that required configuration is present (checked once)"""
+    missing_vars = [var for var in REQUIRED_VARS if not _ENV.get(var)]
+
+    if missing_vars:
+        raise ValueError(
+            f"Missing required environment variables: {', '.join(missing_vars)}")
+
+    return True
 
 
 class Config:
     """System-wide configuration settings"""
 
     # YouTube API Configuration
-    YOUTUBE_API_KEY = os.getenv('YOUTUBE_API_KEY')
-    YOUTUBE_API_SERVICE_NAME = 'youtube'
-    YOUTUBE_API_VERSION = 'v3'
+    YOUTUBE_API_KEY = YOUTUBE_API_KEY
+    YOUTUBE_API_SERVICE_NAME = YOUTUBE_API_SERVICE_NAME
+    YOUTUBE_API_VERSION = YOUTUBE_API_VERSION
 
     # Firebase Configuration
-    FIREBASE_PROJECT_ID = os.getenv('FIREBASE_PROJECT_ID')
-    FIREBASE_CREDENTIALS_PATH = os.getenv(
-        'FIREBASE_CREDENTIALS_PATH', 'deployment/firebase/credentials.json')
+    FIREBASE_PROJECT_ID = FIREBASE_PROJECT_ID
+    FIREBASE_CREDENTIALS_PATH = FIREBASE_CREDENTIALS_PATH
 
     # Claude AI Configuration
-    ANTHROPIC_API_KEY = os.getenv('ANTHROPIC_API_KEY')
-    CLAUDE_MODEL = 'claude-3-sonnet-20240229'
+    ANTHROPIC_API_KEY = ANTHROPIC_API_KEY
+    CLAUDE_MODEL = CLAUDE_MODEL
 
     # Analysis Parameters
-    MAX_VIDEOS_PER_SEARCH = 50
-    DEFAULT_REGION_CODE = 'US'
-    DEFAULT_LANGUAGE = 'en'
+    MAX_VIDEOS_PER_SEARCH = MAX_VIDEOS_PER_SEARCH
+    DEFAULT_REGION_CODE = DEFAULT_REGION_CODE
+    DEFAULT_LANGUAGE = DEFAULT_LANGUAGE
 
     # Scoring Weights
-    SENTIMENT_WEIGHT = 0.3
-    ENGAGEMENT_WEIGHT = 0.4
-    CREDIBILITY_WEIGHT = 0.3
+    SENTIMENT_WEIGHT = SENTIMENT_WEIGHT
+    ENGAGEMENT_WEIGHT = ENGAGEMENT_WEIGHT
+    CREDIBILITY_WEIGHT = CREDIBILITY_WEIGHT
 
     # Directory Configuration
-    PROJECT_ROOT = Path(__file__).parent
-    OUTPUT_DIR = PROJECT_ROOT / 'output'
-    MODELS_DIR = PROJECT_ROOT / 'models'
+    PROJECT_ROOT = PROJECT_ROOT
+    OUTPUT_DIR = OUTPUT_DIR
+    MODELS_DIR = MODELS_DIR
 
     # MCP Server Configuration
-    MCP_SERVER_NAME = 'youtube-intelligence'
-    MCP_SERVER_VERSION = '1.0.0'
-    MCP_SERVER_PORT = 8000
+    MCP_SERVER_NAME = MCP_SERVER_NAME
+    MCP_SERVER_VERSION = MCP_SERVER_VERSION
+    MCP_SERVER_PORT = MCP_SERVER_PORT
 
     # Rate Limiting
-    API_RATE_LIMIT = 100  # requests per minute
+    API_RATE_LIMIT = API_RATE_LIMIT
+    SEARCH_CACHE_TTL = SEARCH_CACHE_TTL
+
+    # Logging
+    LOG_LEVEL = LOG_LEVEL
 
     @classmethod
     def validate_config(cls):
         """Validate that required configuration is present"""
-        required_vars = [
-            'YOUTUBE_API_KEY',
-            'FIREBASE_PROJECT_ID',
-            'ANTHROPIC_API_KEY'
-        ]
-
-        missing_vars = []
-        for var in required_vars:
-            if not getattr(cls, var):
-                missing_vars.append(var)
-
-        if missing_vars:
-            raise ValueError(
-                f"Missing required environment variables: {', '.join(missing_vars)}")
-
-        return True
+        return validate_config()
 
 
 # .env template file
@@ -86,6 +147,8 @@ ANTHROPIC_API_KEY=your_anthropic_api_key_here
 MAX_VIDEOS_PER_SEARCH=50
 DEFAULT_REGION_CODE=US
 DEFAULT_LANGUAGE=en
+SEARCH_CACHE_TTL=86400
+LOG_LEVEL=INFO
 """
 
 if __name__ == "__main__":
@@ -99,7 +162,7 @@ if __name__ == "__main__":
 
     # Validate configuration
     try:
-        Config.validate_config()
+        validate_config()
         print("Configuration validated successfully!")
     except ValueError as e:
         print(f"Configuration error: {e}")
@@ -1,8 +1,12 @@
 # mcp_server.py - Main MCP Server Implementation with Proper Initialization
 
 import asyncio
+import io
 import logging
-from typing import Any, Dict, List, Optional
+import sys
+from itertools import islice
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Final, List, Mapping, Optional
 
 # Correct imports for MCP Server
 from mcp.server import Server
@@ -16,32 +20,82 @@ from mcp.types import (
     Tool,
 )
 
-from config import Config
-from tools.video_search_tool import VideoSearchTool
-from tools.market_analysis_tool import MarketAnalysisTool
-from tools.system_status_tool import SystemStatusTool
+from config import LOG_LEVEL, MCP_SERVER_NAME, MCP_SERVER_VERSION, validate_config
+from tools.schemas import TOOL_METADATA
 
-# Configure logging
+# Configure logging; messages use lazy %-formatting so filtered levels cost
+# nothing beyond the level check
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=LOG_LEVEL,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
+# Shared read-only fallback for missing response sections, so formatters don't
+# allocate a throwaway dict per lookup
+_EMPTY: Final[Mapping[str, Any]] = MappingProxyType({})
+
 # Create the main MCP server instance
-server = Server(Config.MCP_SERVER_NAME, Config.MCP_SERVER_VERSION)
+server = Server(MCP_SERVER_NAME, MCP_SERVER_VERSION)
+
+
+def _load_video_search_tool():
+    from tools.video_search_tool import VideoSearchTool
+    return VideoSearchTool()
+
+
+def _load_market_analysis_tool():
+    from tools.market_analysis_tool import MarketAnalysisTool
+    return MarketAnalysisTool()
 
-# Initialize tools
-youtube_tools = {
-    'search_videos': VideoSearchTool(),
-    'analyze_market': MarketAnalysisTool(),
-    'system_status': SystemStatusTool()
+
+def _load_system_status_tool():
+    from tools.system_status_tool import SystemStatusTool
+    return SystemStatusTool()
+
+
+# Register tool factories; tools (and their heavy imports) are only
+# constructed the first time they are called
+TOOL_FACTORIES: Dict[str, Callable[[], Any]] = {
+    'search_videos': _load_video_search_tool,
+    'analyze_market': _load_market_analysis_tool,
+    'system_status': _load_system_status_tool
 }
+_tool_cache: Dict[str, Any] = {}
+
+
+def _get_tool(name: str) -> Optional[Any]:
+    """Return the tool instance for name, constructing it on first use
+
+    Returns None if no tool is registered under name.
+    """
+    tool = _tool_cache.get(name)
+    if tool is None:
+        factory = TOOL_FACTORIES.get(name)
+        if factory is None:
+            return None
+        tool = _tool_cache[name] = factory()
+    return tool
+
+
+# Preformatted for the unknown-tool error path
+_AVAILABLE_TOOLS_STR: Final[str] = ', '.join(TOOL_FACTORIES)
+
+
+# Tool schemas are immutable, so the list_tools response is built once
+_CACHED_TOOL_LIST: List[Tool] = [
+    Tool(
+        name=TOOL_METADATA[tool_name]['name'],
+        description=TOOL_METADATA[tool_name]['description'],
+        inputSchema=TOOL_METADATA[tool_name]['inputSchema']
+    )
+    for tool_name in TOOL_FACTORIES
+]
 
 # Track initialization state
 _server_initialized = False
 
-logger.info(f"Initialized {len(youtube_tools)} MCP tools")
+logger.info("Registered %s MCP tools", len(TOOL_FACTORIES))
 
 
 @server.list_tools()
@@ -54,20 +108,11 @@ async def list_tools() -> List[Tool]:
                 "Tools requested before server initialization complete")
             return []
 
-        tools_list = []
-        for tool_name, tool_instance in youtube_tools.items():
-            mcp_tool = Tool(
-                name=tool_instance.name,
-                description=tool_instance.description,
-                inputSchema=tool_instance.inputSchema
-            )
-            tools_list.append(mcp_tool)
-
-        logger.info(f"Listed {len(tools_list)} available tools")
-        return tools_list
+        logger.info("Listed %s available tools", len(_CACHED_TOOL_LIST))
+        return _CACHED_TOOL_LIST
 
     except Exception as e:
-        logger.error(f"Error listing tools: {e}")
+        logger.error("Error listing tools: %s", e)
         return []
 
 
@@ -78,17 +123,18 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
         # Check if server is initialized
         if not _server_initialized:
             error_msg = "Server not yet initialized. Please wait for initialization to complete."
-            logger.warning(f"Tool call rejected - {error_msg}")
+            logger.warning("Tool call rejected - %s", error_msg)
             return [TextContent(
                 type="text",
                 text=f"Error: {error_msg}"
             )]
 
-        logger.info(f"Tool call: {name} with arguments: {arguments}")
+        logger.info("Tool call: %s with arguments: %r", name, arguments)
 
         # Find and execute tool
-        if name not in youtube_tools:
-            error_msg = f"Tool '{name}' not found. Available tools: {list(youtube_tools.keys())}"
+        tool_instance = _get_tool(name)
+        if tool_instance is None:
+            error_msg = f"Tool '{name}' not found. Available tools: {_AVAILABLE_TOOLS_STR}"
             logger.error(error_msg)
             return [TextContent(
                 type="text",
@@ -96,7 +142,6 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
             )]
 
         # Execute tool
-        tool_instance = youtube_tools[name]
         result = await tool_instance.call(arguments)
 
         # Format response
@@ -119,6 +164,8 @@ def format_tool_response(tool_name: str, result: Dict[str, Any]) -> str:
         if tool_name == 'search_videos':
             return format_video_search_response(result)
         elif tool_name == 'analyze_market':
+            if 'comparison' in result:
+                return format_market_comparison_response(result)
             return format_market_analysis_response(result)
         elif tool_name == 'system_status':
             return format_system_status_response(result)
@@ -126,126 +173,152 @@ def format_tool_response(tool_name: str, result: Dict[str, Any]) -> str:
             return f"Results from {tool_name}:\n{str(result)}"
 
     except Exception as e:
-        logger.error(f"Error formatting response: {e}")
+        logger.error("Error formatting response: %s", e)
         return f"Tool executed successfully but response formatting failed: {str(result)}"
 
 
 def format_video_search_response(result: Dict[str, Any]) -> str:
     """Format video search results"""
-    response = []
-    response.append(f"**YouTube Video Search Results**")
-    response.append(f"Query: {result.get('query', 'Unknown')}")
-    response.append(f"Found: {result.get('videos_found', 0)} videos")
-    response.append(
-        f"Average Engagement: {result.get('average_engagement', 'N/A')}")
-    response.append("")
-
-    videos = result.get('videos', [])
-    for i, video in enumerate(videos[:10], 1):  # Show top 10
-        response.append(f"{i}. **{video['title']}**")
-        response.append(f"   Channel: {video['channel']}")
-        response.append(
-            f"   Views: {video['views']:,} | Likes: {video['likes']:,} | Comments: {video['comments']:,}")
-        response.append(
-            f"   Engagement: {video['engagement_rate']} | Published: {video['published']}")
-        response.append(
-            f"   Duration: {video['duration']} | Category: {video['category']}")
-        response.append(f"   URL: {video['url']}")
-        response.append("")
-
-    return "\n".join(response)
+    # Every line after the header is written with a leading newline
+    buf = io.StringIO()
+    buf.write(
+        f"**YouTube Video Search Results**\n"
+        f"Query: {result.get('query', 'Unknown')}\n"
+        f"Found: {result.get('videos_found', 0)} videos\n"
+        f"Average Engagement: {result.get('average_engagement', 'N/A')}\n")
+
+    videos = result.get('videos') or ()
+    for i, video in enumerate(islice(videos, 10), 1):  # Show top 10
+        buf.write(
+            f"\n{i}. **{video['title']}**"
+            f"\n   Channel: {video['channel']}"
+            f"\n   Views: {video['views']:,} | Likes: {video['likes']:,} | Comments: {video['comments']:,}"
+            f"\n   Engagement: {video['engagement_rate']} | Published: {video['published']}"
+            f"\n   Duration: {video['duration']} | Category: {video['category']}"
+            f"\n   URL: {video['url']}\n")
+
+    return buf.getvalue()
 
 
 def format_market_analysis_response(result: Dict[str, Any]) -> str:
     """Format market analysis results"""
-    response = []
-    response.append(f"**Market Analysis Results**")
-    response.append(f"Topic: {result.get('topic', 'Unknown')}")
-    response.append(f"Videos Analyzed: {result.get('videos_analyzed', 0)}")
-    response.append(f"Timeframe: {result.get('timeframe_days', 0)} days")
-    response.append("")
+    buf = io.StringIO()
+    buf.write(
+        f"**Market Analysis Results**\n"
+        f"Topic: {result.get('topic', 'Unknown')}\n"
+        f"Videos Analyzed: {result.get('videos_analyzed', 0)}\n"
+        f"Timeframe: {result.get('timeframe_days', 0)} days\n")
 
-    analysis = result.get('analysis', {})
+    analysis = result.get('analysis') or _EMPTY
 
     # Market Overview
-    overview = analysis.get('market_overview', {})
-    response.append("**Market Overview**")
-    response.append(f"• Total Views: {overview.get('total_views', 0):,}")
-    response.append(f"• Average Views: {overview.get('average_views', 0):,}")
-    response.append(
-        f"• Average Engagement: {overview.get('average_engagement_rate', 'N/A')}")
-    response.append(f"• Unique Creators: {overview.get('unique_creators', 0)}")
-    response.append(
-        f"• Competition Level: {overview.get('competition_level', 'Unknown')}")
-    response.append(
-        f"• Market Sentiment: {overview.get('market_sentiment', 'N/A')}")
-    response.append("")
+    overview = analysis.get('market_overview') or _EMPTY
+    buf.write(
+        f"\n**Market Overview**"
+        f"\n• Total Views: {overview.get('total_views', 0):,}"
+        f"\n• Average Views: {overview.get('average_views', 0):,}"
+        f"\n• Average Engagement: {overview.get('average_engagement_rate', 'N/A')}"
+        f"\n• Unique Creators: {overview.get('unique_creators', 0)}"
+        f"\n• Competition Level: {overview.get('competition_level', 'Unknown')}"
+        f"\n• Market Sentiment: {overview.get('market_sentiment', 'N/A')}\n")
 
     # Top Videos
-    top_videos = analysis.get('top_performing_videos', [])
+    top_videos = analysis.get('top_performing_videos') or ()
     if top_videos:
-        response.append("**Top Performing Videos**")
-        for i, video in enumerate(top_videos[:5], 1):
-            response.append(
-                f"{i}. {video['title']} - {video['views']:,} views ({video['channel']})")
-        response.append("")
+        buf.write("\n**Top Performing Videos**")
+        for i, video in enumerate(islice(top_videos, 5), 1):
+            buf.write(
+                f"\n{i}. {video['title']} - {video['views']:,} views ({video['channel']})")
+        buf.write("\n")
 
     # Top Channels
-    top_channels = analysis.get('top_channels', [])
+    top_channels = analysis.get('top_channels') or ()
     if top_channels:
-        response.append("**Top Channels**")
-        for i, channel in enumerate(top_channels[:5], 1):
-            response.append(
-                f"{i}. {channel['channel']} - {channel['total_views']:,} total views ({channel['video_count']} videos)")
-        response.append("")
+        buf.write("\n**Top Channels**")
+        for i, channel in enumerate(islice(top_channels, 5), 1):
+            buf.write(
+                f"\n{i}. {channel['channel']} - {channel['total_views']:,} total views ({channel['video_count']} videos)")
+        buf.write("\n")
 
     # Insights
-    insights = analysis.get('insights', [])
+    insights = analysis.get('insights') or ()
     if insights:
-        response.append("**Key Insights**")
+        buf.write("\n**Key Insights**")
         for insight in insights:
-            response.append(f"• {insight}")
-
-    return "\n".join(response)
+            buf.write(f"\n• {insight}")
+
+    return buf.getvalue()
+
+
+def format_market_comparison_response(result: Dict[str, Any]) -> str:
+    """Format multi-topic market analysis results"""
+    buf = io.StringIO()
+    buf.write(
+        f"**Market Comparison Results**\n"
+        f"Topics: {', '.join(result.get('topics') or ())}\n"
+        f"Videos Analyzed: {result.get('videos_analyzed', 0)}\n"
+        f"Timeframe: {result.get('timeframe_days', 0)} days\n")
+
+    missing = result.get('topics_without_results') or ()
+    if missing:
+        buf.write(f"No videos found for: {', '.join(missing)}\n")
+
+    failed = result.get('topics_failed') or _EMPTY
+    if failed:
+        buf.write(f"Search failed for: {', '.join(failed)}\n")
+
+    # Side-by-side overview, largest markets first
+    buf.write("\n**Topic Comparison**")
+    for i, row in enumerate(result.get('comparison') or (), 1):
+        buf.write(
+            f"\n{i}. {row['topic']} - {row['total_views']:,} total views, "
+            f"{row['average_views']:,} avg views, {row['average_engagement_rate']} engagement"
+            f"\n   Creators: {row['unique_creators']} | Competition: {row['competition_level']}")
+    buf.write("\n")
+
+    # Per-topic insights
+    analyses = result.get('analyses') or _EMPTY
+    for topic, analysis in analyses.items():
+        insights = analysis.get('insights') or ()
+        if insights:
+            buf.write(f"\n**Key Insights: {topic}**")
+            for insight in insights:
+                buf.write(f"\n• {insight}")
+            buf.write("\n")
+
+    return buf.getvalue()
 
 
 def format_system_status_response(result: Dict[str, Any]) -> str:
     """Format system status results"""
-    response = []
-    status = result.get('status', {})
+    buf = io.StringIO()
+    status = result.get('status') or _EMPTY
 
-    response.append(
-        f"⚡ **{status.get('server_name', 'YouTube Intelligence')} System Status**")
-    response.append(f"Version: {status.get('version', 'Unknown')}")
-    response.append(f"Status: {status.get('status', 'Unknown')}")
-    response.append(f"Timestamp: {status.get('timestamp', 'Unknown')}")
-    response.append("")
+    buf.write(
+        f"⚡ **{status.get('server_name', 'YouTube Intelligence')} System Status**\n"
+        f"Version: {status.get('version', 'Unknown')}\n"
+        f"Status: {status.get('status', 'Unknown')}\n"
+        f"Timestamp: {status.get('timestamp', 'Unknown')}\n")
 
     # Configuration
-    config = status.get('configuration', {})
-    response.append("**🔧 Configuration**")
-    response.append(
-        f"• YouTube API: {'Configured' if config.get('youtube_api_configured') else 'Not Configured'}")
-    response.append(
-        f"• Firebase: {'Configured' if config.get('firebase_configured') else 'Not Configured'}")
-    response.append(
-        f"• Claude API: {'Configured' if config.get('claude_api_configured') else 'Not Configured'}")
-    response.append(
-        f"• Max Videos Per Search: {config.get('max_videos_per_search', 'Unknown')}")
-    response.append("")
+    config = status.get('configuration') or _EMPTY
+    buf.write(
+        f"\n**🔧 Configuration**"
+        f"\n• YouTube API: {'Configured' if config.get('youtube_api_configured') else 'Not Configured'}"
+        f"\n• Firebase: {'Configured' if config.get('firebase_configured') else 'Not Configured'}"
+        f"\n• Claude API: {'Configured' if config.get('claude_api_configured') else 'Not Configured'}"
+        f"\n• Max Videos Per Search: {config.get('max_videos_per_search', 'Unknown')}\n")
 
     # System Metrics (if available)
-    metrics = status.get('system_metrics', {})
+    metrics = status.get('system_metrics') or _EMPTY
     if metrics and 'error' not in metrics:
-        response.append("**📊 System Metrics**")
-        response.append(
-            f"• CPU Usage: {metrics.get('cpu_percent', 'Unknown')}%")
-        response.append(
-            f"• Memory Usage: {metrics.get('memory_percent', 'Unknown')}%")
-        response.append(
-            f"• Disk Usage: {metrics.get('disk_usage_percent', 'Unknown')}%")
+        buf.write(
+            f"\n**📊 System Metrics**"
+            f"\n• CPU Usage: {metrics.get('cpu_percent', 'Unknown')}%"
+            f"\n• Memory Usage: {metrics.get('memory_percent', 'Unknown')}%"
+            f"\n• Disk Usage: {metrics.get('disk_usage_percent', 'Unknown')}%")
 
-    return "\n".join(response)
+    return buf.getvalue()
 
 
 async def initialize_server():
@@ -256,20 +329,20 @@ async def initialize_server():
         logger.info("Initializing YouTube Intelligence MCP Server")
 
         # Validate configuration
-        Config.validate_config()
+        validate_config()
         logger.info("Configuration validated successfully")
 
-        # Initialize tools (already done above, but verify they're working)
-        for tool_name, tool_instance in youtube_tools.items():
-            logger.debug(
-                f"Tool '{tool_name}' initialized: {tool_instance.name}")
+        # Tools are constructed lazily on first call
+        if logger.isEnabledFor(logging.DEBUG):
+            for tool_name in TOOL_FACTORIES:
+                logger.debug("Tool '%s' registered", tool_name)
 
         # Mark server as initialized
         _server_initialized = True
         logger.info("Server initialization complete")
 
     except Exception as e:
-        logger.error(f"Server initialization failed: {e}")
+        logger.error("Server initialization failed: %s", e)
         raise
 
 
@@ -284,13 +357,12 @@ async def main():
 
         # Create initialization options
         init_options = InitializationOptions(
-            server_name=Config.MCP_SERVER_NAME,
-            server_version=Config.MCP_SERVER_VERSION,
+            server_name=MCP_SERVER_NAME,
+            server_version=MCP_SERVER_VERSION,
             capabilities=capabilities
         )
 
-        logger.info(
-            f"Starting {Config.MCP_SERVER_NAME} v{Config.MCP_SERVER_VERSION}")
+        logger.info("Starting %s v%s", MCP_SERVER_NAME, MCP_SERVER_VERSION)
 
         # Run stdio server
         async with stdio_server() as (read_stream, write_stream):
@@ -299,8 +371,14 @@ async def main():
     except KeyboardInterrupt:
         logger.info("Server shutdown requested")
     except Exception as e:
-        logger.error(f"Server failed to start: {e}")
+        logger.error("Server failed to start: %s", e)
         raise
+    finally:
+        # Tools load the YouTube service lazily; close its HTTP client only
+        # if a tool call actually opened it
+        youtube_service = sys.modules.get('services.youtube_service')
+        if youtube_service is not None:
+            await youtube_service.close_http_client()
 
 
 if __name__ == "__main__":
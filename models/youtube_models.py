@@ -1,9 +1,10 @@
 # models/youtube_models.py - YouTube Data Structures
 # Data Models & Architecture
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 
 
 class VideoCategory(str, Enum):
@@ -25,9 +26,9 @@ class VideoStats(BaseModel):
     comment_count: int = 0
     duration_seconds: int = 0
 
-    @property
+    @cached_property
     def engagement_rate(self) -> float:
-        """Calculate engagement rate (likes + comments) / views"""
+        """Calculate engagement rate (likes + comments) / views, computed once"""
         if self.view_count == 0:
             return 0.0
         return (self.like_count + self.comment_count) / self.view_count
@@ -76,6 +77,8 @@ class ChannelData(BaseModel):
 
 class SearchQuery(BaseModel):
     """YouTube search query parameters"""
+    model_config = ConfigDict(frozen=True)
+
     query: str
     max_results: int = 25
     region_code: str = "US"
@@ -85,6 +88,14 @@ class SearchQuery(BaseModel):
     order: str = "relevance"  # relevance, date, rating, viewCount
 
 
+class ChannelStats(BaseModel):
+    """Per-channel sufficient statistics within a search result"""
+    video_count: int = 0
+    view_sum: int = 0
+    view_sq_sum: int = 0
+    engagement_sum: float = 0.0
+
+
 class SearchResult(BaseModel):
     """YouTube search results"""
     query: SearchQuery
@@ -92,13 +103,37 @@ class SearchResult(BaseModel):
     total_results: int
     search_time: datetime = Field(default_factory=datetime.now)
 
-    @property
+    @cached_property
     def average_engagement(self) -> float:
-        """Calculate average engagement rate across all videos"""
+        """Calculate average engagement rate across all videos, computed once"""
         if not self.videos:
             return 0.0
         return sum(video.stats.engagement_rate for video in self.videos) / len(self.videos)
 
+    @cached_property
+    def channel_stats(self) -> Dict[str, ChannelStats]:
+        """Aggregate views and engagement per channel, computed once per result"""
+        totals: Dict[str, List[Any]] = {}
+        for video in self.videos:
+            views = video.stats.view_count
+            entry = totals.get(video.channel_title)
+            if entry is None:
+                totals[video.channel_title] = [1, views, views * views, video.stats.engagement_rate]
+            else:
+                entry[0] += 1
+                entry[1] += views
+                entry[2] += views * views
+                entry[3] += video.stats.engagement_rate
+        return {
+            channel: ChannelStats.model_construct(
+                video_count=count,
+                view_sum=view_sum,
+                view_sq_sum=view_sq_sum,
+                engagement_sum=engagement_sum
+            )
+            for channel, (count, view_sum, view_sq_sum, engagement_sum) in totals.items()
+        }
+
 
 class MarketTrend(BaseModel):
     """Market trend analysis data"""
@@ -1,39 +1,156 @@
 # services/youtube_service.py - YouTube API Integration
 # YouTube Service Integration
 
+import asyncio
 import logging
-from typing import List, Optional, Dict, Any
+import re
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Optional, Dict, Any, Final, Mapping
 from datetime import datetime, timedelta
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
-import isodate
+from cachetools import TTLCache
+import httpx
+import orjson
 
-from config import Config
+from config import SEARCH_CACHE_TTL, YOUTUBE_API_KEY, YOUTUBE_API_SERVICE_NAME, YOUTUBE_API_VERSION
 from models.youtube_models import VideoData, ChannelData, SearchQuery, SearchResult, VideoStats, VideoCategory
 
 logger = logging.getLogger(__name__)
 
+# Shared read-only fallback for optional response sections
+_EMPTY: Final[Mapping[str, Any]] = MappingProxyType({})
+
+# YouTube Data API REST base URL, called directly instead of through the
+# googleapiclient discovery document
+API_BASE_URL = f'https://www.googleapis.com/{YOUTUBE_API_SERVICE_NAME}/{YOUTUBE_API_VERSION}'
+
+# Keyword patterns per category, checked in priority order. Each category is
+# compiled into a single alternation so it is matched in one C-level scan.
+_CATEGORY_PATTERNS = tuple(
+    (category, re.compile('|'.join(map(re.escape, keywords))))
+    for category, keywords in (
+        (VideoCategory.EDUCATION, ('tutorial', 'learn', 'education', 'course')),
+        (VideoCategory.TECHNOLOGY, ('tech', 'programming', 'software', 'ai')),
+        (VideoCategory.GAMING, ('game', 'gaming', 'play')),
+        (VideoCategory.MUSIC, ('music', 'song', 'album')),
+        (VideoCategory.NEWS, ('news', 'breaking', 'report')),
+        (VideoCategory.SPORTS, ('sport', 'football', 'basketball')),
+    )
+)
+
+# YouTube durations are ISO 8601 of the form P#DT#H#M#S (weeks/days only on
+# very long streams)
+_DURATION_RE = re.compile(
+    r'P(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?')
+
+# Python 3.11+ parses RFC 3339 timestamps with a trailing 'Z' natively; older
+# versions need the suffix rewritten as an explicit offset
+if sys.version_info >= (3, 11):
+    _parse_timestamp = datetime.fromisoformat
+else:
+    def _parse_timestamp(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+# Response caches; repeated identical calls skip the quota-limited API
+_SEARCH_CACHE: TTLCache = TTLCache(maxsize=512, ttl=SEARCH_CACHE_TTL)
+_CHANNEL_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=3600)
+_TRENDING_CACHE: TTLCache = TTLCache(maxsize=64, ttl=900)
+
+# Searches currently being fetched, so concurrent identical calls share one
+# API round trip instead of each missing the cache
+_PENDING_SEARCHES: Dict[SearchQuery, asyncio.Future] = {}
+
+# One HTTP/2 client shared by every YouTubeService in the process (each tool
+# builds its own service), created on first use and closed at shutdown
+_HTTP_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide HTTP client, creating it on first use"""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None:
+        # One persistent HTTP/2 connection is reused and multiplexed across
+        # searches and concurrent video batch requests from all tools
+        _HTTP_CLIENT = httpx.AsyncClient(http2=True, timeout=10.0)
+    return _HTTP_CLIENT
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client, if one was opened"""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is not None:
+        await _HTTP_CLIENT.aclose()
+        _HTTP_CLIENT = None
+
+
+@lru_cache(maxsize=2048)
+def _parse_duration(duration: str) -> int:
+    """Convert a YouTube ISO 8601 duration into whole seconds"""
+    match = _DURATION_RE.fullmatch(duration)
+    if match is None:
+        raise ValueError(f"Invalid duration: {duration}")
+
+    weeks, days, hours, minutes, seconds = match.groups()
+    return (int(weeks or 0) * 604800 + int(days or 0) * 86400 + int(hours or 0) * 3600
+            + int(minutes or 0) * 60 + int(seconds or 0))
+
+
+def _categorize(title: str, description: str) -> VideoCategory:
+    """Categorize video content by keyword"""
+    # Lowercase each field separately rather than concatenating first; no
+    # keyword contains a space, so matching across the join is impossible
+    title = title.lower()
+    description = description.lower()
+
+    # Simple keyword-based categorization
+    for category, pattern in _CATEGORY_PATTERNS:
+        if pattern.search(title) or pattern.search(description):
+            return category
+    return VideoCategory.OTHER
+
 
 class YouTubeService:
     """YouTube Data API service for video and channel operations"""
 
     def __init__(self, api_key: str = None):
-        self.api_key = api_key or Config.YOUTUBE_API_KEY
+        self.api_key = api_key or YOUTUBE_API_KEY
         if not self.api_key:
             raise ValueError("YouTube API key is required")
 
-        self.youtube = build(
-            Config.YOUTUBE_API_SERVICE_NAME,
-            Config.YOUTUBE_API_VERSION,
-            developerKey=self.api_key
-        )
-
         logger.info("YouTube service initialized successfully")
 
-    def search_videos(self, query: SearchQuery) -> SearchResult:
+    async def search_videos(self, query: SearchQuery) -> SearchResult:
         """Search for videos using YouTube Data API"""
+        # SearchQuery is frozen, so identical queries hash and compare equal
+        cache_key = query
+        cached = _SEARCH_CACHE.get(cache_key)
+        if cached is not None:
+            logger.info("Search cache hit for query: %s", query.query)
+            return cached
+
+        pending = _PENDING_SEARCHES.get(cache_key)
+        if pending is not None:
+            logger.info("Joining in-flight search for query: %s", query.query)
+            return await asyncio.shield(pending)
+
+        pending = _PENDING_SEARCHES[cache_key] = asyncio.ensure_future(
+            self._fetch_search(query))
+        try:
+            result = await asyncio.shield(pending)
+        finally:
+            _PENDING_SEARCHES.pop(cache_key, None)
+
+        # Only a fully fetched, non-empty result is worth keeping; failed
+        # batches raise out of _fetch_search and never reach this point
+        if result.videos:
+            _SEARCH_CACHE[cache_key] = result
+        return result
+
+    async def _fetch_search(self, query: SearchQuery) -> SearchResult:
+        """Run a search against the API, bypassing the result cache"""
         try:
-            logger.info(f"Searching videos for query: {query.query}")
+            logger.info("Searching videos for query: %s", query.query)
 
             # Build search parameters
             search_params = {
@@ -53,162 +170,138 @@ class YouTubeService:
                 search_params['publishedBefore'] = query.published_before.isoformat()
 
             # Execute search
-            search_response = self.youtube.search().list(**search_params).execute()
+            search_response = await self._api_get('search', search_params)
 
             # Extract video IDs for detailed information
             video_ids = [item['id']['videoId']
                          for item in search_response['items']]
 
             # Get detailed video information
-            videos = self._get_video_details(video_ids)
+            videos = await self._get_video_details(video_ids)
 
             # Create search result
             result = SearchResult(
                 query=query,
                 videos=videos,
-                total_results=search_response.get(
-                    'pageInfo', {}).get('totalResults', 0)
+                total_results=(search_response.get('pageInfo') or _EMPTY).get('totalResults', 0)
             )
 
-            logger.info(f"Found {len(videos)} videos for query: {query.query}")
+            logger.info("Found %s videos for query: %s", len(videos), query.query)
             return result
 
-        except HttpError as e:
-            logger.error(f"YouTube API error: {e}")
+        except httpx.HTTPStatusError as e:
+            logger.error("YouTube API error: %s", e)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error in video search: {e}")
+            logger.error("Unexpected error in video search: %s", e)
             raise
 
-    def _get_video_details(self, video_ids: List[str]) -> List[VideoData]:
+    async def _api_get(self, resource: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """GET a YouTube Data API resource and decode the JSON response"""
+        response = await _get_http_client().get(
+            f"{API_BASE_URL}/{resource}",
+            params={**params, 'key': self.api_key}
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    async def _get_video_details(self, video_ids: List[str]) -> List[VideoData]:
         """Get detailed information for specific video IDs"""
         if not video_ids:
             return []
 
-        try:
-            # YouTube API allows max 50 IDs per request
-            videos = []
-            for i in range(0, len(video_ids), 50):
-                batch_ids = video_ids[i:i+50]
-                batch_videos = self._fetch_video_batch(batch_ids)
-                videos.extend(batch_videos)
-
-            return videos
+        # YouTube API allows max 50 IDs per request; fetch all batches concurrently.
+        # A failed batch propagates so the partial search is not cached
+        batches = [video_ids[i:i+50] for i in range(0, len(video_ids), 50)]
+        batch_results = await asyncio.gather(
+            *(self._fetch_video_batch(batch_ids) for batch_ids in batches))
 
-        except Exception as e:
-            logger.error(f"Error getting video details: {e}")
-            return []
+        return [video for batch_videos in batch_results for video in batch_videos]
 
-    def _fetch_video_batch(self, video_ids: List[str]) -> List[VideoData]:
+    async def _fetch_video_batch(self, video_ids: List[str]) -> List[VideoData]:
         """Fetch a batch of video details"""
         try:
-            video_response = self.youtube.videos().list(
-                part='snippet,statistics,contentDetails',
-                id=','.join(video_ids)
-            ).execute()
-
-            videos = []
-            for item in video_response['items']:
-                video = self._parse_video_item(item)
-                if video:
-                    videos.append(video)
+            video_response = await self._api_get('videos', {
+                'part': 'snippet,statistics,contentDetails',
+                'id': ','.join(video_ids)
+            })
+        except Exception as e:
+            logger.error("Error fetching video batch: %s", e)
+            raise
 
-            return videos
+        videos = []
+        for item in video_response['items']:
+            video = self._parse_video_item(item)
+            if video:
+                videos.append(video)
 
-        except Exception as e:
-            logger.error(f"Error fetching video batch: {e}")
-            return []
+        return videos
 
     def _parse_video_item(self, item: Dict[str, Any]) -> Optional[VideoData]:
         """Parse YouTube API video item into VideoData model"""
+        # Fixed-shape parse: every field is read exactly once into a local and
+        # module-level helpers are called directly
         try:
             snippet = item['snippet']
-            statistics = item.get('statistics', {})
-            content_details = item.get('contentDetails', {})
-
-            # Parse duration
-            duration_str = content_details.get('duration', 'PT0S')
-            duration_seconds = int(isodate.parse_duration(
-                duration_str).total_seconds())
-
-            # Create video stats
-            stats = VideoStats(
+            statistics = item.get('statistics') or _EMPTY
+            duration_str = (item.get('contentDetails') or _EMPTY).get('duration', 'PT0S')
+            title = snippet['title']
+            description = snippet.get('description', '')
+
+            # Fields are already coerced here, so skip pydantic validation
+            # for the per-video models
+            stats = VideoStats.model_construct(
                 view_count=int(statistics.get('viewCount', 0)),
                 like_count=int(statistics.get('likeCount', 0)),
                 comment_count=int(statistics.get('commentCount', 0)),
-                duration_seconds=duration_seconds
+                duration_seconds=_parse_duration(duration_str)
             )
 
-            # Determine category
-            category = self._categorize_video(snippet.get(
-                'title', ''), snippet.get('description', ''))
-
-            # Parse published date
-            published_at = datetime.fromisoformat(
-                snippet['publishedAt'].replace('Z', '+00:00'))
-
-            # Create video data
-            video = VideoData(
+            return VideoData.model_construct(
                 video_id=item['id'],
-                title=snippet['title'],
-                description=snippet.get('description', ''),
+                title=title,
+                description=description,
                 channel_id=snippet['channelId'],
                 channel_title=snippet['channelTitle'],
-                published_at=published_at,
+                published_at=_parse_timestamp(snippet['publishedAt']),
                 duration=duration_str,
-                category=category,
+                category=_categorize(title, description),
                 stats=stats,
-                tags=snippet.get('tags', []),
-                thumbnail_url=snippet.get(
-                    'thumbnails', {}).get('high', {}).get('url')
+                tags=snippet.get('tags') or [],
+                thumbnail_url=((snippet.get('thumbnails') or _EMPTY).get('high') or _EMPTY).get('url')
             )
 
-            return video
-
         except Exception as e:
-            logger.error(f"Error parsing video item: {e}")
+            logger.error("Error parsing video item: %s", e)
             return None
 
     def _categorize_video(self, title: str, description: str) -> VideoCategory:
         """Categorize video based on title and description"""
-        content = (title + ' ' + description).lower()
-
-        # Simple keyword-based categorization
-        if any(word in content for word in ['tutorial', 'learn', 'education', 'course']):
-            return VideoCategory.EDUCATION
-        elif any(word in content for word in ['tech', 'programming', 'software', 'ai']):
-            return VideoCategory.TECHNOLOGY
-        elif any(word in content for word in ['game', 'gaming', 'play']):
-            return VideoCategory.GAMING
-        elif any(word in content for word in ['music', 'song', 'album']):
-            return VideoCategory.MUSIC
-        elif any(word in content for word in ['news', 'breaking', 'report']):
-            return VideoCategory.NEWS
-        elif any(word in content for word in ['sport', 'football', 'basketball']):
-            return VideoCategory.SPORTS
-        else:
-            return VideoCategory.OTHER
-
-    def get_channel_info(self, channel_id: str) -> Optional[ChannelData]:
+        return _categorize(title, description)
+
+    async def get_channel_info(self, channel_id: str) -> Optional[ChannelData]:
         """Get detailed channel information"""
+        cached = _CHANNEL_CACHE.get(channel_id)
+        if cached is not None:
+            return cached
+
         try:
-            channel_response = self.youtube.channels().list(
-                part='snippet,statistics',
-                id=channel_id
-            ).execute()
+            channel_response = await self._api_get('channels', {
+                'part': 'snippet,statistics',
+                'id': channel_id
+            })
 
             if not channel_response['items']:
                 return None
 
             item = channel_response['items'][0]
             snippet = item['snippet']
-            statistics = item.get('statistics', {})
+            statistics = item.get('statistics') or _EMPTY
 
             # Parse creation date
             created_at = None
             if 'publishedAt' in snippet:
-                created_at = datetime.fromisoformat(
-                    snippet['publishedAt'].replace('Z', '+00:00'))
+                created_at = _parse_timestamp(snippet['publishedAt'])
 
             channel = ChannelData(
                 channel_id=channel_id,
@@ -218,25 +311,30 @@ class YouTubeService:
                 video_count=int(statistics.get('videoCount', 0)),
                 view_count=int(statistics.get('viewCount', 0)),
                 created_at=created_at,
-                thumbnail_url=snippet.get(
-                    'thumbnails', {}).get('high', {}).get('url')
+                thumbnail_url=((snippet.get('thumbnails') or _EMPTY).get('high') or _EMPTY).get('url')
             )
 
+            _CHANNEL_CACHE[channel_id] = channel
             return channel
 
         except Exception as e:
-            logger.error(f"Error getting channel info: {e}")
+            logger.error("Error getting channel info: %s", e)
             return None
 
-    def get_trending_videos(self, region_code: str = 'US', max_results: int = 25) -> List[VideoData]:
+    async def get_trending_videos(self, region_code: str = 'US', max_results: int = 25) -> List[VideoData]:
         """Get trending videos for a specific region"""
+        cache_key = (region_code, max_results)
+        cached = _TRENDING_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            videos_response = self.youtube.videos().list(
-                part='snippet,statistics,contentDetails',
-                chart='mostPopular',
-                regionCode=region_code,
-                maxResults=min(max_results, 50)
-            ).execute()
+            videos_response = await self._api_get('videos', {
+                'part': 'snippet,statistics,contentDetails',
+                'chart': 'mostPopular',
+                'regionCode': region_code,
+                'maxResults': min(max_results, 50)
+            })
 
             videos = []
             for item in videos_response['items']:
@@ -244,10 +342,12 @@ class YouTubeService:
                 if video:
                     videos.append(video)
 
+            if videos:
+                _TRENDING_CACHE[cache_key] = videos
             return videos
 
         except Exception as e:
-            logger.error(f"Error getting trending videos: {e}")
+            logger.error("Error getting trending videos: %s", e)
             return []
 
 
@@ -265,7 +365,7 @@ if __name__ == "__main__":
             order="viewCount"
         )
 
-        results = youtube_service.search_videos(query)
+        results = asyncio.run(youtube_service.search_videos(query))
         print(f"Search Results: {len(results.videos)} videos found")
 
         for video in results.videos:
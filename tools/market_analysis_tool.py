@@ -1,46 +1,65 @@
 # tools/market_analysis_tool.py - Market Analysis Tool
 
+import asyncio
+import heapq
 import logging
-from typing import Any, Dict, List
-from datetime import datetime, timedelta
+import math
+import operator
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Sequence
+from datetime import datetime, timedelta, timezone
 from mcp import Tool
-import pandas as pd
-from textblob import TextBlob
+import numpy as np
 
 from services.youtube_service import YouTubeService
 from models.youtube_models import SearchQuery
+from tools.schemas import MARKET_ANALYSIS_TOOL
+from tools.sentiment import MIN_SCORED_LENGTH, title_polarity
+from tools.timestamps import DAY, youtube_timestamp
 
 logger = logging.getLogger(__name__)
 
+# Word tokenizer for title sentiment; keeps contractions like "don't" intact
+_TOKEN_RE = re.compile(r"[a-z]+(?:'[a-z]+)*")
+
+# Competition levels by unique channel count: more than 15 is Medium,
+# more than 30 is High
+_COMPETITION_LEVELS = ("Low", "Medium", "High")
+_COMPETITION_THRESHOLDS = np.array([15, 30])
+
+# Per-video fields read by the analysis, fetched in one call per video
+_VIDEO_FIELDS = operator.attrgetter(
+    'title', 'stats.view_count', 'stats.engagement_rate', 'stats.duration_seconds',
+    'published_at')
+
+# Multi-topic calls: each topic costs one quota-expensive search, so the
+# topic count is capped and only a few searches run at once
+_MAX_TOPICS = 10
+_MAX_CONCURRENT_SEARCHES = 5
+
+# Market overview fields repeated in the multi-topic comparison rows
+_COMPARISON_FIELDS = (
+    "total_views", "average_views", "average_engagement_rate",
+    "unique_creators", "competition_level")
+
+
+@dataclass
+class _MarketArrays:
+    """Per-video column arrays shared between the analysis steps"""
+    views: np.ndarray
+    engagement: np.ndarray
+    durations: np.ndarray
+    published: np.ndarray  # POSIX seconds, UTC
+    views_mean: float
+    views_std: float
+
 
 class MarketAnalysisTool(Tool):
     """MCP tool for YouTube market analysis and trends"""
 
     def __init__(self):
-        super().__init__(
-            name="analyze_market",
-            description="Analyze YouTube market trends and competition for specific topics",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "topic": {
-                        "type": "string",
-                        "description": "Topic or niche to analyze"
-                    },
-                    "timeframe_days": {
-                        "type": "integer",
-                        "description": "Analyze videos from last N days (default: 30)",
-                        "default": 30
-                    },
-                    "sample_size": {
-                        "type": "integer",
-                        "description": "Number of videos to analyze (default: 50)",
-                        "default": 50
-                    }
-                },
-                "required": ["topic"]
-            }
-        )
+        super().__init__(**MARKET_ANALYSIS_TOOL)
         self.youtube_service = YouTubeService()
 
     async def call(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
@@ -50,7 +69,28 @@ class MarketAnalysisTool(Tool):
             timeframe_days = arguments.get("timeframe_days", 30)
             sample_size = min(arguments.get("sample_size", 50), 100)
 
-            logger.info(f"Analyzing market for topic: {topic}")
+            topics = arguments.get("topics")
+            if topics:
+                if not isinstance(topics, list) or not all(isinstance(t, str) for t in topics):
+                    return {
+                        "success": False,
+                        "message": "topics must be a list of strings"
+                    }
+                topics = list(dict.fromkeys(topics))  # drop repeats, keep order
+                if len(topics) > _MAX_TOPICS:
+                    return {
+                        "success": False,
+                        "message": f"At most {_MAX_TOPICS} topics can be analyzed per call"
+                    }
+                return await self._analyze_topics(topics, timeframe_days, sample_size)
+
+            if not topic:
+                return {
+                    "success": False,
+                    "message": "topic or topics is required"
+                }
+
+            logger.info("Analyzing market for topic: %s", topic)
 
             # Search for recent videos with proper timestamp formatting
             published_after = self._format_youtube_timestamp(timeframe_days)
@@ -61,7 +101,7 @@ class MarketAnalysisTool(Tool):
                 order="viewCount"
             )
 
-            results = self.youtube_service.search_videos(search_query)
+            results = await self.youtube_service.search_videos(search_query)
 
             if not results.videos:
                 return {
@@ -70,7 +110,7 @@ class MarketAnalysisTool(Tool):
                 }
 
             # Analyze market metrics
-            analysis = self._analyze_market_data(results.videos, topic)
+            analysis = self._analyze_market_data(results, topic)
 
             return {
                 "success": True,
@@ -81,13 +121,89 @@ class MarketAnalysisTool(Tool):
             }
 
         except Exception as e:
-            logger.error(f"Market analysis error: {e}")
+            logger.error("Market analysis error: %s", e)
             return {
                 "success": False,
                 "error": str(e),
                 "message": "Failed to analyze market"
             }
 
+    async def _analyze_topics(self, topics, timeframe_days, sample_size):
+        """Analyze several topics concurrently and compare them side by side"""
+        logger.info("Analyzing market for %d topics", len(topics))
+
+        published_after = self._format_youtube_timestamp(timeframe_days)
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_SEARCHES)
+
+        async def search(topic):
+            async with semaphore:
+                return await self.youtube_service.search_videos(SearchQuery(
+                    query=topic,
+                    max_results=sample_size,
+                    published_after=published_after,
+                    order="viewCount"
+                ))
+
+        # One failed search must not discard the topics that succeeded
+        all_results = await asyncio.gather(
+            *(search(topic) for topic in topics), return_exceptions=True)
+
+        found = []
+        without_results = []
+        failed = {}
+        for topic, results in zip(topics, all_results):
+            if isinstance(results, Exception):
+                logger.error("Market search failed for topic %s: %s", topic, results)
+                failed[topic] = str(results)
+            elif isinstance(results, BaseException):
+                raise results
+            elif results.videos:
+                found.append((topic, results))
+            else:
+                without_results.append(topic)
+
+        if not found:
+            return {
+                "success": False,
+                "topics_without_results": without_results,
+                "topics_failed": failed,
+                "message": (
+                    f"Market search failed for topics: {', '.join(failed)}" if failed
+                    else f"No videos found for topics: {', '.join(topics)}")
+            }
+
+        analyses = {
+            topic: self._analyze_market_data(results, topic)
+            for topic, results in found
+        }
+
+        # Comparison rows reuse each topic's overview; largest markets first,
+        # ties keep the requested topic order
+        comparison = sorted(
+            (
+                {
+                    "topic": topic,
+                    "videos_analyzed": len(results.videos),
+                    **{field: analyses[topic]["market_overview"][field]
+                       for field in _COMPARISON_FIELDS}
+                }
+                for topic, results in found
+            ),
+            key=lambda row: row["total_views"],
+            reverse=True
+        )
+
+        return {
+            "success": True,
+            "topics": [topic for topic, _ in found],
+            "topics_without_results": without_results,
+            "topics_failed": failed,
+            "timeframe_days": timeframe_days,
+            "videos_analyzed": sum(len(results.videos) for _, results in found),
+            "comparison": comparison,
+            "analyses": analyses
+        }
+
     def _format_youtube_timestamp(self, days_ago: int = 30) -> str:
         """
         Format timestamp for YouTube API with proper timezone
@@ -98,56 +214,70 @@ class MarketAnalysisTool(Tool):
         Returns:
             Properly formatted timestamp string for YouTube API
         """
-        # Calculate the date X days ago using UTC
-        past_date = datetime.utcnow() - timedelta(days=days_ago)
+        # Day buckets keep repeated analyses of a topic on one cached search;
+        # an extra partial day does not matter for an N-day trend window
+        return youtube_timestamp(days_ago, granularity=DAY)
 
-        # Format as ISO string with 'Z' timezone indicator
-        # YouTube API requires either 'Z' or a valid timezone offset
-        return past_date.isoformat() + 'Z'
-
-    def _analyze_market_data(self, videos, topic):
+    def _analyze_market_data(self, results, topic):
         """Analyze market data and generate insights"""
-        # Convert to DataFrame for analysis
-        data = []
-        for video in videos:
-            data.append({
-                'title': video.title,
-                'views': video.stats.view_count,
-                'likes': video.stats.like_count,
-                'comments': video.stats.comment_count,
-                'engagement_rate': video.stats.engagement_rate,
-                'channel': video.channel_title,
-                'published': video.published_at,
-                'duration_seconds': video.stats.duration_seconds
-            })
-
-        df = pd.DataFrame(data)
-
-        # Calculate market metrics
-        total_views = df['views'].sum()
-        avg_views = df['views'].mean()
-        avg_engagement = df['engagement_rate'].mean()
+        # Collect the per-video fields into column arrays in a single pass
+        videos = results.videos
+        n = len(videos)
+        titles = np.empty(n, dtype=object)
+        views = np.empty(n, dtype=np.int64)
+        engagement = np.empty(n, dtype=np.float64)
+        durations = np.empty(n, dtype=np.float64)
+        published = np.empty(n, dtype=np.float64)  # POSIX seconds, UTC
+        for i, video in enumerate(videos):
+            titles[i], views[i], engagement[i], durations[i], published_at = _VIDEO_FIELDS(video)
+            if published_at.tzinfo is None:
+                published_at = published_at.replace(tzinfo=timezone.utc)
+            published[i] = published_at.timestamp()
+
+        # Calculate market metrics from the per-channel view the result
+        # materializes once, so repeat analyses of a cached search skip it
+        channel_stats = results.channel_stats
+        total_views = sum(stats.view_sum for stats in channel_stats.values())
+        total_sq_views = sum(stats.view_sq_sum for stats in channel_stats.values())
+        avg_views = total_views / n
+        avg_engagement = engagement.mean()
+        # Sample std from the sufficient statistics; the numerator is an exact int
+        views_std = (
+            math.sqrt((n * total_sq_views - total_views * total_views) / (n * (n - 1)))
+            if n > 1 else 0.0
+        )
 
         # Find top performers
-        top_videos = df.nlargest(5, 'views')[
-            ['title', 'views', 'channel']].to_dict('records')
-
-        # Channel analysis
-        channel_performance = df.groupby('channel').agg({
-            'views': ['sum', 'mean', 'count'],
-            'engagement_rate': 'mean'
-        }).round(2)
-
-        top_channels = channel_performance.nlargest(5, ('views', 'sum'))
-
-        # Sentiment analysis on titles
-        sentiments = [
-            TextBlob(title).sentiment.polarity for title in df['title']]
-        avg_sentiment = sum(sentiments) / len(sentiments) if sentiments else 0
+        top_videos = [
+            {'title': titles[i], 'views': int(views[i]), 'channel': videos[i].channel_title}
+            for i in _top_indices(views, 5)
+        ]
+
+        # Channel analysis: ties on total views keep channel-name order
+        top_channels = heapq.nlargest(
+            5, sorted(channel_stats.items()), key=lambda item: item[1].view_sum)
+
+        # Sentiment analysis on titles; titles too short to hold a lexicon
+        # word score 0 and only count towards the average
+        scorable = [title for title in titles if len(title) >= MIN_SCORED_LENGTH]
+        avg_sentiment = (
+            sum(title_polarity(_TOKEN_RE.findall(title.lower())) for title in scorable) / n
+            if scorable else 0.0
+        )
 
         # Competition analysis
-        unique_channels = df['channel'].nunique()
-        competition_level = "High" if unique_channels > 30 else "Medium" if unique_channels > 15 else "Low"
+        unique_channels = len(channel_stats)
+        competition_level = _COMPETITION_LEVELS[
+            int(np.searchsorted(_COMPETITION_THRESHOLDS, unique_channels, side='left'))]
+
+        arrays = _MarketArrays(
+            views=views,
+            engagement=engagement,
+            durations=durations,
+            published=published,
+            views_mean=avg_views,
+            views_std=views_std
+        )
 
         return {
             "market_overview": {
@@ -161,32 +291,31 @@ class MarketAnalysisTool(Tool):
             "top_performing_videos": top_videos,
             "top_channels": [
                 {
-                    "channel": idx,
-                    "total_views": int(row[('views', 'sum')]),
-                    "avg_views": int(row[('views', 'mean')]),
-                    "video_count": int(row[('views', 'count')]),
-                    "avg_engagement": f"{row[('engagement_rate', 'mean')]:.2%}"
+                    "channel": channel,
+                    "total_views": stats.view_sum,
+                    "avg_views": int(round(stats.view_sum / stats.video_count, 2)),
+                    "video_count": stats.video_count,
+                    "avg_engagement": f"{round(stats.engagement_sum / stats.video_count, 2):.2%}"
                 }
-                for idx, row in top_channels.head(5).iterrows()
+                for channel, stats in top_channels
             ],
-            "insights": self._generate_market_insights(df, topic, competition_level)
+            "insights": self._generate_market_insights(arrays, topic, competition_level)
         }
 
-    def _generate_market_insights(self, df, topic, competition_level):
+    def _generate_market_insights(self, arrays, topic, competition_level):
         """Generate actionable market insights"""
         insights = []
+        n = arrays.views.size
 
         # View distribution insight
-        views_std = df['views'].std()
-        views_mean = df['views'].mean()
-        if views_std > views_mean:
+        if arrays.views_std > arrays.views_mean:
             insights.append(
                 "High variance in video performance - opportunity for viral content")
 
         # Engagement insight
-        high_engagement = df[df['engagement_rate'] > 0.05]
-        if len(high_engagement) > 0:
-            avg_duration = high_engagement['duration_seconds'].mean()
+        high_engagement = arrays.engagement > 0.05
+        if high_engagement.any():
+            avg_duration = arrays.durations[high_engagement].mean()
             insights.append(
                 f"High-engagement videos average {int(avg_duration/60)} minutes duration")
 
@@ -199,25 +328,30 @@ class MarketAnalysisTool(Tool):
                 "High competition - focus on unique angle or underserved subtopics")
 
         # Upload timing insight
-        try:
-            # Make the comparison datetime timezone-aware to match the data
-            from datetime import timezone
-            cutoff_date = datetime.now(timezone.utc) - timedelta(days=7)
-
-            # Convert published dates to datetime if they're strings
-            if not df.empty and not pd.api.types.is_datetime64_any_dtype(df['published']):
-                df['published'] = pd.to_datetime(df['published'], utc=True)
-
-            # Ensure published column is timezone-aware
-            if not df.empty and df['published'].dt.tz is None:
-                df['published'] = df['published'].dt.tz_localize('UTC')
-
-            recent_videos = df[df['published'] > cutoff_date]
-            if len(recent_videos) > len(df) * 0.3:
-                insights.append(
-                    "High recent activity - trending topic with immediate opportunity")
-        except Exception as e:
-            logger.warning(f"Could not analyze upload timing: {e}")
-            # Skip this insight if there are datetime issues
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=7)).timestamp()
+        recent_videos = int((arrays.published > cutoff).sum())
+        if recent_videos > n * 0.3:
+            insights.append(
+                "High recent activity - trending topic with immediate opportunity")
 
         return insights
+
+
+# Below this many values a heap over a plain list beats NumPy's partition
+_HEAP_SELECT_MAX = 32
+
+
+def _top_indices(values: np.ndarray, k: int) -> Sequence[int]:
+    """Indices of the k largest values, largest first; ties keep input order"""
+    if values.size <= _HEAP_SELECT_MAX:
+        # nlargest is stable, so equal values stay in position order
+        return heapq.nlargest(k, range(values.size), key=values.tolist().__getitem__)
+    if values.size > k:
+        # Partition to find the k-th largest value, then keep everything at or
+        # above it so boundary ties are resolved by position, not arbitrarily
+        kth_largest = np.partition(values, values.size - k)[values.size - k]
+        candidates = np.flatnonzero(values >= kth_largest)
+    else:
+        candidates = np.arange(values.size)
+    order = np.argsort(-values[candidates], kind='stable')[:k]
+    return candidates[order]
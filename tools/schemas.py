@@ -0,0 +1,89 @@
+# tools/schemas.py - Static MCP Tool Metadata
+# Kept free of heavy imports so the server can advertise tools without
+# constructing them (and without loading their service dependencies).
+
+VIDEO_SEARCH_TOOL = {
+    "name": "search_videos",
+    "description": "Search YouTube videos with detailed analysis and insights",
+    "inputSchema": {
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": "Search query for YouTube videos"
+            },
+            "max_results": {
+                "type": "integer",
+                "description": "Maximum number of results to return (default: 10)",
+                "default": 10
+            },
+            "order": {
+                "type": "string",
+                "description": "Sort order: relevance, date, rating, viewCount",
+                "default": "relevance"
+            },
+            "region_code": {
+                "type": "string",
+                "description": "Region code for localized results (default: US)",
+                "default": "US"
+            },
+            "published_after_days": {
+                "type": "integer",
+                "description": "Filter videos published within last N days (optional)",
+                "default": None
+            }
+        },
+        "required": ["query"]
+    }
+}
+
+MARKET_ANALYSIS_TOOL = {
+    "name": "analyze_market",
+    "description": "Analyze YouTube market trends and competition for specific topics",
+    "inputSchema": {
+        "type": "object",
+        "properties": {
+            "topic": {
+                "type": "string",
+                "description": "Topic or niche to analyze (this or topics is required)"
+            },
+            "topics": {
+                "type": "array",
+                "items": {"type": "string"},
+                "maxItems": 10,
+                "description": "Up to 10 topics to analyze and compare in one call (instead of topic)"
+            },
+            "timeframe_days": {
+                "type": "integer",
+                "description": "Analyze videos from last N days (default: 30)",
+                "default": 30
+            },
+            "sample_size": {
+                "type": "integer",
+                "description": "Number of videos to analyze (default: 50)",
+                "default": 50
+            }
+        }
+    }
+}
+
+SYSTEM_STATUS_TOOL = {
+    "name": "system_status",
+    "description": "Get YouTube Intelligence MCP Server system status and health metrics",
+    "inputSchema": {
+        "type": "object",
+        "properties": {
+            "include_detailed": {
+                "type": "boolean",
+                "description": "Include detailed system metrics",
+                "default": False
+            }
+        }
+    }
+}
+
+# Registration order matches the order tools are listed to clients
+TOOL_METADATA = {
+    tool["name"]: tool
+    for tool in (VIDEO_SEARCH_TOOL, MARKET_ANALYSIS_TOOL, SYSTEM_STATUS_TOOL)
+}
@@ -0,0 +1,70 @@
+# tools/sentiment.py - Lightweight Title Sentiment Scoring
+# Lexicon-based polarity in the style of TextBlob's pattern analyzer, without
+# loading TextBlob/NLTK. Scores are in [-1.0, 1.0].
+
+from typing import Iterable
+
+# Word polarities taken from the pattern/TextBlob English lexicon, restricted
+# to evaluative words common in video titles
+_POLARITY = {
+    'advanced': 0.4, 'amazing': 0.6, 'awesome': 1.0, 'bad': -0.7,
+    'beautiful': 0.85, 'best': 1.0, 'better': 0.5, 'boring': -1.0,
+    'brilliant': 0.9, 'broken': -0.4, 'cheap': 0.4, 'classic': 0.167,
+    'clean': 0.367, 'cold': -0.6, 'complete': 0.1, 'cool': 0.35, 'crazy': -0.6,
+    'cute': 0.5, 'dangerous': -0.6, 'dark': -0.15, 'dead': -0.2,
+    'difficult': -0.5, 'dirty': -0.6, 'easy': 0.433, 'effective': 0.6,
+    'epic': 0.1, 'excellent': 1.0, 'exciting': 0.3, 'expensive': -0.5,
+    'fail': -0.5, 'fake': -0.5, 'famous': 0.5, 'fantastic': 0.4, 'fast': 0.2,
+    'favorite': 0.5, 'fine': 0.417, 'free': 0.4, 'fresh': 0.3, 'full': 0.35,
+    'fun': 0.3, 'funny': 0.25, 'good': 0.7, 'great': 0.8, 'greatest': 1.0,
+    'happy': 0.8, 'hard': -0.292, 'honest': 0.6, 'horrible': -1.0, 'hot': 0.25,
+    'huge': 0.4, 'important': 0.4, 'impossible': -0.667, 'incredible': 0.9,
+    'insane': -1.0, 'interesting': 0.5, 'latest': 0.5, 'lazy': -0.25,
+    'legendary': 1.0, 'little': -0.188, 'long': -0.05, 'love': 0.5,
+    'lovely': 0.5, 'mad': -0.625, 'magic': 0.5, 'new': 0.136, 'nice': 0.6,
+    'normal': 0.15, 'old': 0.1, 'perfect': 1.0, 'poor': -0.4, 'popular': 0.6,
+    'powerful': 0.3, 'pretty': 0.25, 'professional': 0.1, 'pure': 0.214,
+    'quick': 0.333, 'rare': 0.3, 'real': 0.2, 'ridiculous': -0.333,
+    'right': 0.286, 'sad': -0.5, 'safe': 0.5, 'scary': -0.5, 'secret': -0.4,
+    'serious': -0.333, 'shocking': -1.0, 'slow': -0.3, 'small': -0.25,
+    'smart': 0.214, 'special': 0.357, 'strange': -0.05, 'strong': 0.433,
+    'stupid': -0.8, 'successful': 0.75, 'super': 0.333, 'sweet': 0.35,
+    'terrible': -1.0, 'top': 0.5, 'tough': -0.389, 'true': 0.35, 'ugly': -0.7,
+    'unbelievable': -0.25, 'unique': 0.375, 'useful': 0.3, 'useless': -0.5,
+    'weird': -0.5, 'wild': 0.1, 'wonderful': 1.0, 'worse': -0.4, 'worst': -1.0,
+    'wow': 0.1, 'wrong': -0.5, 'young': 0.1
+}
+
+# Shortest lexicon word; text shorter than this always scores 0.0
+MIN_SCORED_LENGTH = min(map(len, _POLARITY))
+
+# A negation flips and halves the word right after it ("not good" -> -0.35)
+_NEGATIONS = frozenset((
+    "not", "no", "never", "isn't", "aren't", "wasn't", "don't", "doesn't",
+    "didn't", "can't", "won't"
+))
+
+# Intensifiers scale the word right after it ("very good" -> 0.91)
+_INTENSIFIERS = {"very": 1.3}
+
+
+def title_polarity(tokens: Iterable[str]) -> float:
+    """Average polarity of the lexicon words in lowercased tokens (0.0 if none)"""
+    total = 0.0
+    count = 0
+    modifier = 1.0
+    for token in tokens:
+        if token in _NEGATIONS:
+            modifier *= -0.5
+            continue
+        intensity = _INTENSIFIERS.get(token)
+        if intensity is not None:
+            modifier *= intensity
+            continue
+        polarity = _POLARITY.get(token)
+        if polarity is not None:
+            total += max(-1.0, min(1.0, polarity * modifier))
+            count += 1
+        # Modifiers only reach the word directly after them
+        modifier = 1.0
+    return total / count if count else 0.0
@@ -1,35 +1,49 @@
 # tools/system_status_tool.py - System Status Tool
 
+import asyncio
 import logging
 import os
-import psutil
-from typing import Any, Dict
-from datetime import datetime
+import threading
+from functools import lru_cache
+from typing import Any, Dict, Optional
+from cachetools import TTLCache
 from mcp import Tool
 
-from config import Config
+from config import (
+    ANTHROPIC_API_KEY,
+    FIREBASE_PROJECT_ID,
+    MAX_VIDEOS_PER_SEARCH,
+    MCP_SERVER_NAME,
+    MCP_SERVER_VERSION,
+    OUTPUT_DIR,
+    YOUTUBE_API_KEY,
+)
+from tools.schemas import SYSTEM_STATUS_TOOL
+from tools.timestamps import utc_now_iso
 
 logger = logging.getLogger(__name__)
 
+# Latest whole-system CPU usage, refreshed every second by a daemon thread
+# so status calls read a current value without sleeping to sample
+_CPU_SAMPLE_INTERVAL = 1.0
+_cpu_percent: Optional[float] = None
+_cpu_sampled = threading.Event()
+
+# Process and connection counts barely move sub-second, so reuse them briefly
+_PROC_COUNTS_CACHE: TTLCache = TTLCache(maxsize=2, ttl=2)
+
+# Kernel socket summaries; their "inuse" fields avoid walking every socket.
+# sockstat6 is absent on kernels without IPv6
+_SOCKSTAT_PATH = '/proc/net/sockstat'
+_SOCKSTAT6_PATH = '/proc/net/sockstat6'
+_SOCKSTAT_PROTOCOLS = frozenset(('TCP:', 'UDP:', 'TCP6:', 'UDP6:'))
+
 
 class SystemStatusTool(Tool):
     """MCP tool for system status and health monitoring"""
 
     def __init__(self):
-        super().__init__(
-            name="system_status",
-            description="Get YouTube Intelligence MCP Server system status and health metrics",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "include_detailed": {
-                        "type": "boolean",
-                        "description": "Include detailed system metrics",
-                        "default": False
-                    }
-                }
-            }
-        )
+        super().__init__(**SYSTEM_STATUS_TOOL)
 
     async def call(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Get system status"""
@@ -38,23 +52,23 @@ class SystemStatusTool(Tool):
 
             # Basic system info
             status = {
-                "server_name": Config.MCP_SERVER_NAME,
-                "version": Config.MCP_SERVER_VERSION,
-                "timestamp": datetime.utcnow().isoformat() + 'Z',  # Fixed timestamp format
+                "server_name": MCP_SERVER_NAME,
+                "version": MCP_SERVER_VERSION,
+                "timestamp": utc_now_iso(),
                 "status": "healthy",
                 "uptime_seconds": self._get_uptime(),
                 "configuration": {
-                    "youtube_api_configured": bool(Config.YOUTUBE_API_KEY),
-                    "firebase_configured": bool(Config.FIREBASE_PROJECT_ID),
-                    "claude_api_configured": bool(Config.ANTHROPIC_API_KEY),
-                    "output_directory": str(Config.OUTPUT_DIR),
-                    "max_videos_per_search": Config.MAX_VIDEOS_PER_SEARCH
+                    "youtube_api_configured": bool(YOUTUBE_API_KEY),
+                    "firebase_configured": bool(FIREBASE_PROJECT_ID),
+                    "claude_api_configured": bool(ANTHROPIC_API_KEY),
+                    "output_directory": str(OUTPUT_DIR),
+                    "max_videos_per_search": MAX_VIDEOS_PER_SEARCH
                 }
             }
 
             # Add detailed metrics if requested
             if include_detailed:
-                status["system_metrics"] = self._get_system_metrics()
+                status["system_metrics"] = await self._get_system_metrics()
                 status["api_status"] = self._check_api_status()
 
             return {
@@ -63,7 +77,7 @@ class SystemStatusTool(Tool):
             }
 
         except Exception as e:
-            logger.error(f"System status error: {e}")
+            logger.error("System status error: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -73,29 +87,107 @@ class SystemStatusTool(Tool):
     def _get_uptime(self) -> float:
         """Get system uptime in seconds"""
         try:
-            return psutil.boot_time()
+            return _psutil().boot_time()
         except Exception as e:
-            logger.error(f"Error getting uptime: {e}")
+            logger.error("Error getting uptime: %s", e)
             return 0.0
 
-    def _get_system_metrics(self) -> Dict[str, Any]:
+    async def _get_system_metrics(self) -> Dict[str, Any]:
         """Get detailed system metrics"""
         try:
+            psutil = _psutil()
             return {
-                "cpu_percent": psutil.cpu_percent(interval=1),
+                "cpu_percent": await _current_cpu_percent(),
                 "memory_percent": psutil.virtual_memory().percent,
                 "disk_usage_percent": psutil.disk_usage('/').percent,
-                "process_count": len(psutil.pids()),
-                "network_connections": len(psutil.net_connections())
+                "process_count": self._count_processes(),
+                "network_connections": self._count_net_connections()
             }
         except Exception as e:
-            logger.error(f"Error getting system metrics: {e}")
+            logger.error("Error getting system metrics: %s", e)
             return {"error": "Unable to retrieve system metrics"}
 
+    def _count_processes(self) -> int:
+        """Count running processes, cached for a couple of seconds"""
+        count = _PROC_COUNTS_CACHE.get('processes')
+        if count is None:
+            try:
+                count = sum(1 for entry in os.listdir('/proc') if entry.isdigit())
+            except OSError:
+                count = len(_psutil().pids())
+            _PROC_COUNTS_CACHE['processes'] = count
+        return count
+
+    def _count_net_connections(self) -> int:
+        """Count open TCP/UDP sockets, cached for a couple of seconds"""
+        count = _PROC_COUNTS_CACHE.get('connections')
+        if count is None:
+            try:
+                count = _read_sockstat_inuse()
+            except OSError:
+                count = len(_psutil().net_connections())
+            _PROC_COUNTS_CACHE['connections'] = count
+        return count
+
     def _check_api_status(self) -> Dict[str, str]:
         """Check API configuration status"""
         return {
-            "youtube_api": "configured" if Config.YOUTUBE_API_KEY else "not_configured",
-            "firebase": "configured" if Config.FIREBASE_PROJECT_ID else "not_configured",
-            "claude_api": "configured" if Config.ANTHROPIC_API_KEY else "not_configured"
+            "youtube_api": "configured" if YOUTUBE_API_KEY else "not_configured",
+            "firebase": "configured" if FIREBASE_PROJECT_ID else "not_configured",
+            "claude_api": "configured" if ANTHROPIC_API_KEY else "not_configured"
         }
+
+
+@lru_cache(maxsize=1)
+def _psutil():
+    """Import psutil on first use, so loading this module stays cheap"""
+    import psutil
+    return psutil
+
+
+@lru_cache(maxsize=1)
+def _start_cpu_sampler() -> None:
+    """Start the CPU sampler thread once, on the first detailed-metrics request"""
+    threading.Thread(
+        target=_sample_cpu, args=(_psutil(),), name="cpu-sampler", daemon=True).start()
+
+
+def _sample_cpu(psutil) -> None:
+    """Store back-to-back CPU usage samples for the life of the process"""
+    global _cpu_percent
+    while True:
+        _cpu_percent = psutil.cpu_percent(interval=_CPU_SAMPLE_INTERVAL)
+        _cpu_sampled.set()
+
+
+async def _current_cpu_percent() -> float:
+    """Latest sampled CPU usage; only a read before the first sample waits"""
+    _start_cpu_sampler()
+    if not _cpu_sampled.is_set():
+        # Wait in a worker thread so the event loop keeps serving other calls
+        await asyncio.to_thread(_cpu_sampled.wait, _CPU_SAMPLE_INTERVAL * 2)
+    return _cpu_percent if _cpu_percent is not None else 0.0
+
+
+def _read_sockstat_inuse() -> int:
+    """Sum the TCP/UDP "inuse" counters from /proc/net/sockstat{,6}
+
+    Raises OSError only if the IPv4 summary itself cannot be read.
+    """
+    total = _sum_sockstat_inuse(_SOCKSTAT_PATH)
+    try:
+        total += _sum_sockstat_inuse(_SOCKSTAT6_PATH)
+    except OSError:
+        pass  # IPv6 disabled; the IPv4 count still stands
+    return total
+
+
+def _sum_sockstat_inuse(path: str) -> int:
+    """Sum the TCP/UDP "inuse" counters in one sockstat file"""
+    total = 0
+    with open(path) as sockstat:
+        for line in sockstat:
+            fields = line.split()
+            if fields and fields[0] in _SOCKSTAT_PROTOCOLS:
+                total += int(fields[2])
+    return total
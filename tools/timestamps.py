@@ -0,0 +1,52 @@
+# tools/timestamps.py - Shared UTC Timestamp Helpers
+# Timestamps are bucketed (to the minute or UTC day for API filters, to the
+# second for status reports) and memoized, so calls within a bucket reuse one
+# string and identical searches in a bucket produce identical SearchQuery
+# values, which is what lets them hit the search cache.
+
+import time
+from functools import lru_cache
+
+# Bucket sizes for youtube_timestamp, in seconds
+MINUTE = 60
+DAY = 86400
+
+
+def _format_utc(seconds: int) -> str:
+    """Format a POSIX second as ISO 8601 UTC, without building a datetime"""
+    tm = time.gmtime(seconds)
+    return (f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}"
+            f"T{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}Z")
+
+
+@lru_cache(maxsize=256)
+def _iso_days_before(days_ago: int, bucket_start: int) -> str:
+    """Format bucket_start, minus days_ago days, as ISO 8601 UTC"""
+    return _format_utc(bucket_start - days_ago * DAY)
+
+
+@lru_cache(maxsize=1)
+def _iso_at_second(second: int) -> str:
+    """Format a POSIX second as ISO 8601 UTC"""
+    return _format_utc(second)
+
+
+def youtube_timestamp(days_ago: int = 30, granularity: int = MINUTE) -> str:
+    """
+    Format a timestamp N days ago for YouTube API date filters
+
+    Args:
+        days_ago: Number of days ago from now
+        granularity: Bucket size in seconds (MINUTE or DAY) the current time
+            is truncated to before subtracting days_ago
+
+    Returns:
+        ISO 8601 UTC timestamp with 'Z' suffix
+    """
+    now = int(time.time())
+    return _iso_days_before(days_ago, now - now % granularity)
+
+
+def utc_now_iso() -> str:
+    """Current UTC time as an ISO 8601 string with 'Z' suffix, to the second"""
+    return _iso_at_second(int(time.time()))
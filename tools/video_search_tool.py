@@ -2,53 +2,24 @@
 
 import logging
 from typing import Any, Dict, List
-from datetime import datetime, timedelta
 from mcp import Tool
 
 from services.youtube_service import YouTubeService
 from models.youtube_models import SearchQuery
+from tools.schemas import VIDEO_SEARCH_TOOL
+from tools.timestamps import youtube_timestamp
 
 logger = logging.getLogger(__name__)
 
+# Date format for the "published" field of each video row
+_PUBLISHED_FORMAT = "%Y-%m-%d"
+
 
 class VideoSearchTool(Tool):
     """MCP tool for searching YouTube videos"""
 
     def __init__(self):
-        super().__init__(
-            name="search_videos",
-            description="Search YouTube videos with detailed analysis and insights",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query for YouTube videos"
-                    },
-                    "max_results": {
-                        "type": "integer",
-                        "description": "Maximum number of results to return (default: 10)",
-                        "default": 10
-                    },
-                    "order": {
-                        "type": "string",
-                        "description": "Sort order: relevance, date, rating, viewCount",
-                        "default": "relevance"
-                    },
-                    "region_code": {
-                        "type": "string",
-                        "description": "Region code for localized results (default: US)",
-                        "default": "US"
-                    },
-                    "published_after_days": {
-                        "type": "integer",
-                        "description": "Filter videos published within last N days (optional)",
-                        "default": None
-                    }
-                },
-                "required": ["query"]
-            }
-        )
+        super().__init__(**VIDEO_SEARCH_TOOL)
         self.youtube_service = YouTubeService()
 
     async def call(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
@@ -61,25 +32,21 @@ class VideoSearchTool(Tool):
             region_code = arguments.get("region_code", "US")
             published_after_days = arguments.get("published_after_days", None)
 
-            logger.info(f"Searching videos: {query_text}")
+            logger.info("Searching videos: %s", query_text)
 
             # Create search query with optional date filter
-            search_query_params = {
-                "query": query_text,
-                "max_results": max_results,
-                "order": order,
-                "region_code": region_code
-            }
-
-            # Add date filter if specified
-            if published_after_days is not None:
-                search_query_params["published_after"] = self._format_youtube_timestamp(
-                    published_after_days)
-
-            search_query = SearchQuery(**search_query_params)
+            search_query = SearchQuery(
+                query=query_text,
+                max_results=max_results,
+                order=order,
+                region_code=region_code,
+                published_after=(
+                    self._format_youtube_timestamp(published_after_days)
+                    if published_after_days is not None else None)
+            )
 
             # Execute search
-            results = self.youtube_service.search_videos(search_query)
+            results = await self.youtube_service.search_videos(search_query)
 
             # Format results for MCP response
             response = {
@@ -93,31 +60,33 @@ class VideoSearchTool(Tool):
                     "region_code": region_code,
                     "max_results": max_results,
                     "published_after_days": published_after_days
-                },
-                "videos": []
+                }
             }
 
-            # Add video details
-            for video in results.videos:
-                video_data = {
+            # Add video details into a list sized up front
+            videos_out: List[Any] = [None] * len(results.videos)
+            for i, video in enumerate(results.videos):
+                stats = video.stats
+                desc = getattr(video, 'description_snippet', '') or ''
+                videos_out[i] = {
                     "title": video.title,
                     "channel": video.channel_title,
-                    "views": video.stats.view_count,
-                    "likes": video.stats.like_count,
-                    "comments": video.stats.comment_count,
-                    "engagement_rate": f"{video.stats.engagement_rate:.2%}",
-                    "published": video.published_at.strftime("%Y-%m-%d"),
+                    "views": stats.view_count,
+                    "likes": stats.like_count,
+                    "comments": stats.comment_count,
+                    "engagement_rate": f"{stats.engagement_rate:.2%}",
+                    "published": video.published_at.strftime(_PUBLISHED_FORMAT),
                     "duration": video.duration,
                     "category": video.category.value,
                     "url": f"https://youtube.com/watch?v={video.video_id}",
-                    "description_snippet": getattr(video, 'description_snippet', '')[:200] + '...' if hasattr(video, 'description_snippet') and len(getattr(video, 'description_snippet', '')) > 200 else getattr(video, 'description_snippet', '')
+                    "description_snippet": desc[:200] + ('...' if len(desc) > 200 else '')
                 }
-                response["videos"].append(video_data)
+            response["videos"] = videos_out
 
             return response
 
         except Exception as e:
-            logger.error(f"Video search error: {e}")
+            logger.error("Video search error: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -134,12 +103,7 @@ class VideoSearchTool(Tool):
         Returns:
             Properly formatted timestamp string for YouTube API
         """
-        # Calculate the date X days ago using UTC
-        past_date = datetime.utcnow() - timedelta(days=days_ago)
-
-        # Format as ISO string with 'Z' timezone indicator
-        # YouTube API requires either 'Z' or a valid timezone offset
-        return past_date.isoformat() + 'Z'
+        return youtube_timestamp(days_ago)
 
     def get_tool_schema(self) -> Dict[str, Any]:
         """Return the complete tool schema for MCP registration"""